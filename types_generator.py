@@ -11,6 +11,8 @@ Requirements
 ------------
 - Python 3.9+
 - PySide6 (`pip install PySide6`)
+- lxml (optional, `pip install lxml`) for faster import
+- pygixml (optional, `pip install pygixml`) for the fastest import
 
 Run:
     python types_generator.py
@@ -26,34 +28,47 @@ Notes
 from __future__ import annotations
 import sys
 import os
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from functools import lru_cache
+from typing import List, Optional, Dict, Iterator
 import xml.etree.ElementTree as ET
-
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QAction
+from xml.sax.saxutils import escape as _xml_escape
+
+# lxml (libxml2) is optional: much faster parsing.
+try:
+    from lxml import etree as LET
+except ImportError:
+    LET = ET
+
+# pygixml (pugixml bindings) is optional: fastest parser for large types.xml files.
+try:
+    import pygixml
+    _PARSER = "pygixml"
+except ImportError:
+    _PARSER = "et"
+
+from PySide6.QtCore import QModelIndex, QStringListModel
+from PySide6.QtGui import QAction, QPalette, QColor
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog, QMessageBox,
     QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QLineEdit, QSpinBox,
-    QCheckBox, QPushButton, QListWidget, QListWidgetItem, QComboBox, QGroupBox,
-    QSplitter
+    QCheckBox, QPushButton, QListWidget, QListView, QAbstractItemView, QComboBox,
+    QGroupBox, QSplitter
 )
 
 
 
 # ----------------------------- Theme / Styling ----------------------------- #
-from PySide6.QtGui import QPalette, QColor
 
 DARK_QSS = """
 * { font-size: 12px; }
 QWidget { background-color: #121212; color: #E6E6E6; }
-QLineEdit, QComboBox, QListWidget, QSpinBox {
+QLineEdit, QComboBox, QListView, QSpinBox {
     background-color: #1E1E1E;
     border: 1px solid #2A2A2A;
     border-radius: 8px;
     padding: 6px;
 }
-QListWidget::item { padding: 6px; margin: 2px; }
+QListView::item { padding: 6px; margin: 2px; }
 QPushButton {
     background-color: #2A2F3A;
     border: 1px solid #3A3F4A;
@@ -79,11 +94,11 @@ QSplitter::handle {
     width: 6px;
     margin: 0 2px;
 }
-QScrollBar:vertical, QScrollBar:horizontal {
+QScrollBar:vertical {
     background: #1A1A1A;
     border: 1px solid #2A2A2A;
 }
-QScrollBar::handle:vertical, QScrollBar::handle:horizontal {
+QScrollBar::handle:vertical {
     background: #2F2F2F;
     min-height: 24px;
 }
@@ -92,7 +107,7 @@ QScrollBar::handle:vertical, QScrollBar::handle:horizontal {
 LIGHT_QSS = """
 * { font-size: 12px; }
 QWidget { background-color: #FFFFFF; color: #1C1C1C; }
-QLineEdit, QComboBox, QListWidget, QSpinBox {
+QLineEdit, QComboBox, QListView, QSpinBox {
     background-color: #FFFFFF;
     border: 1px solid #D9D9D9;
     border-radius: 8px;
@@ -125,8 +140,9 @@ QSplitter::handle {
 }
 """
 
+# The Fusion style is set once in main(); switching themes only swaps the
+# palette and the application stylesheet.
 def apply_dark_palette(app):
-    app.setStyle("Fusion")
     palette = QPalette()
     palette.setColor(QPalette.Window, QColor(18,18,18))
     palette.setColor(QPalette.WindowText, QColor(230,230,230))
@@ -144,7 +160,6 @@ def apply_dark_palette(app):
     app.setStyleSheet(DARK_QSS)
 
 def apply_light_palette(app):
-    app.setStyle("Fusion")
     app.setPalette(QPalette())  # reset to default
     app.setStyleSheet(LIGHT_QSS)
 # ---- Preset dropdown options ----
@@ -161,116 +176,197 @@ TAG_PRESETS = ["none","shelves","floor","ground"]
 
 # ----------------------------- Data Model ----------------------------- #
 
-@dataclass
+def _pg_attr(node, key: str) -> Optional[str]:
+    a = node.attribute(key)
+    return a.value if a else None
+
+# child tags read by TypeEntry.from_xml
+_INT_TAGS = frozenset({"nominal", "lifetime", "restock", "min", "quantmin", "quantmax", "cost"})
+_LIST_TAGS = {"usage": "usages", "value": "values", "tag": "tags"}
+
+# flag attributes, in output order; TypeEntry.flags packs them as bit i = FLAG_KEYS[i]
+FLAG_KEYS = ("count_in_cargo", "count_in_hoarder", "count_in_map", "count_in_player", "crafted", "deloot")
+FLAG_DEFAULT = 1 << FLAG_KEYS.index("count_in_map")
+
+SPIN_MAX = 2_147_483_647  # QSpinBox is int32
+
+_ATTR_ENTITIES = {'"': "&quot;"}
+
+@lru_cache(maxsize=4096)
+def _esc(s: str) -> str:
+    """Escape an attribute value; memoized since the same presets repeat across entries."""
+    return _xml_escape(s, _ATTR_ENTITIES)
+# pre-rendered <flags .../> line for every bitmask value
+_FLAGS_XML = tuple(
+    "        <flags " + " ".join(f'{k}="{(m >> i) & 1}"' for i, k in enumerate(FLAG_KEYS)) + "/>\n"
+    for m in range(1 << len(FLAG_KEYS))
+)
+
 class TypeEntry:
-    name: str
-    nominal: Optional[int] = None
-    lifetime: Optional[int] = None
-    restock: Optional[int] = None
-    min: Optional[int] = None
-    quantmin: Optional[int] = None
-    quantmax: Optional[int] = None
-    cost: Optional[int] = None
-    # flags attributes
-    flags: Dict[str, int] = field(default_factory=lambda: {
-        "count_in_cargo": 0,
-        "count_in_hoarder": 0,
-        "count_in_map": 1,
-        "count_in_player": 0,
-        "crafted": 0,
-        "deloot": 0,
-    })
-    category: Optional[str] = None
-    usages: List[str] = field(default_factory=list)
-    values: List[str] = field(default_factory=list)
-    tags: List[str] = field(default_factory=list)
+    __slots__ = ("name", "nominal", "lifetime", "restock", "min", "quantmin", "quantmax", "cost",
+                 "flags", "category", "usages", "values", "tags", "_xml_cache")
+
+    def __init__(self, name: str, nominal: Optional[int] = None, lifetime: Optional[int] = None,
+                 restock: Optional[int] = None, min: Optional[int] = None,
+                 quantmin: Optional[int] = None, quantmax: Optional[int] = None,
+                 cost: Optional[int] = None, flags: int = FLAG_DEFAULT,
+                 category: Optional[str] = None, usages: Optional[List[str]] = None,
+                 values: Optional[List[str]] = None, tags: Optional[List[str]] = None):
+        self.name = name
+        self.nominal = nominal
+        self.lifetime = lifetime
+        self.restock = restock
+        self.min = min
+        self.quantmin = quantmin
+        self.quantmax = quantmax
+        self.cost = cost
+        self.flags = flags  # bitmask over FLAG_KEYS
+        self.category = category
+        self.usages = usages if usages is not None else []
+        self.values = values if values is not None else []
+        self.tags = tags if tags is not None else []
+        # rendered to_xml_str() output; not tracked automatically, see to_xml_str
+        self._xml_cache: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"TypeEntry(name={self.name!r}, category={self.category!r})"
+
+    def flag(self, key: str) -> int:
+        return (self.flags >> FLAG_KEYS.index(key)) & 1
+
+    def set_flag(self, key: str, v: int):
+        bit = 1 << FLAG_KEYS.index(key)
+        if v:
+            self.flags |= bit
+        else:
+            self.flags &= ~bit
+        self._xml_cache = None
 
     @staticmethod
     def from_xml(elem: ET.Element) -> "TypeEntry":
-        name = elem.get("name", "")
-        def get_int(tag: str) -> Optional[int]:
-            t = elem.find(tag)
-            if t is not None and (t.text or "").strip() != "":
-                try:
-                    return int(t.text.strip())
-                except ValueError:
-                    return None
-            return None
-        entry = TypeEntry(
-            name=name,
-            nominal=get_int("nominal"),
-            lifetime=get_int("lifetime"),
-            restock=get_int("restock"),
-            min=get_int("min"),
-            quantmin=get_int("quantmin"),
-            quantmax=get_int("quantmax"),
-            cost=get_int("cost"),
-        )
+        # single pass over the children instead of one find() per field
+        ints: Dict[str, int] = {}
+        lists: Dict[str, List[str]] = {"usages": [], "values": [], "tags": []}
+        flags_elem = None
+        category = None
+        for child in elem:
+            ct = child.tag
+            if ct in _INT_TAGS:
+                txt = child.text
+                if txt and txt.strip():
+                    try:
+                        ints[ct] = int(txt.strip())
+                    except ValueError:
+                        pass
+            elif ct in _LIST_TAGS:
+                n = child.get("name")
+                if n:
+                    lists[_LIST_TAGS[ct]].append(n)
+            elif ct == "flags":
+                flags_elem = child
+            elif ct == "category":
+                category = child.get("name")
+        entry = TypeEntry(name=elem.get("name", ""), category=category, **ints, **lists)
         # flags
-        flags_elem = elem.find("flags")
         if flags_elem is not None:
-            for k in entry.flags.keys():
-                v = flags_elem.get(k)
-                if v is not None:
+            entry._read_flags(flags_elem.get)
+        return entry
+
+    @staticmethod
+    def from_pygixml(node) -> "TypeEntry":
+        """Same as from_xml, for a pygixml <type> node."""
+        ints: Dict[str, int] = {}
+        lists: Dict[str, List[str]] = {"usages": [], "values": [], "tags": []}
+        flags_node = None
+        category = None
+        for child in node.children():
+            ct = child.name
+            if ct in _INT_TAGS:
+                txt = child.child_value()
+                if txt and txt.strip():
                     try:
-                        entry.flags[k] = int(v)
+                        ints[ct] = int(txt.strip())
                     except ValueError:
                         pass
-        # category
-        cat_elem = elem.find("category")
-        if cat_elem is not None:
-            entry.category = cat_elem.get("name")
-        # usages/values/tags (multiple)
-        entry.usages = [u.get("name") for u in elem.findall("usage") if u.get("name")]
-        entry.values = [v.get("name") for v in elem.findall("value") if v.get("name")]
-        entry.tags = [t.get("name") for t in elem.findall("tag") if t.get("name")]
+            elif ct in _LIST_TAGS:
+                n = _pg_attr(child, "name")
+                if n:
+                    lists[_LIST_TAGS[ct]].append(n)
+            elif ct == "flags":
+                flags_node = child
+            elif ct == "category":
+                category = _pg_attr(child, "name")
+        entry = TypeEntry(name=_pg_attr(node, "name") or "", category=category, **ints, **lists)
+        if flags_node is not None:
+            entry._read_flags(lambda k: _pg_attr(flags_node, k))
         return entry
 
-    def to_xml(self) -> ET.Element:
-        t = ET.Element("type", name=self.name)
-        def put_int(tag: str, val: Optional[int]):
+    def _read_flags(self, get):
+        """Set flags from `get(key)`, which returns the attribute text or None."""
+        for k in FLAG_KEYS:
+            v = get(k)
+            if v is not None:
+                try:
+                    self.set_flag(k, int(v))
+                except ValueError:
+                    pass
+
+    def to_xml_str(self) -> str:
+        """Render this entry as a <type> block indented by 4 spaces per level.
+
+        The result is cached. Only set_flag() resets the cache; code that
+        assigns a field or mutates a list on an entry that may already have
+        been rendered must set `_xml_cache = None` itself. The editor does not
+        need to: collect_entry builds a fresh entry for every save.
+        """
+        if self._xml_cache is None:
+            self._xml_cache = self._render_xml()
+        return self._xml_cache
+
+    def _render_xml(self) -> str:
+        parts = [f'    <type name="{_xml_escape(self.name, _ATTR_ENTITIES)}">\n']
+        for tag in ("nominal", "lifetime", "restock", "min", "quantmin", "quantmax", "cost"):
+            val = getattr(self, tag)
             if val is not None:
-                e = ET.SubElement(t, tag)
-                e.text = str(val)
-        put_int("nominal", self.nominal)
-        put_int("lifetime", self.lifetime)
-        put_int("restock", self.restock)
-        put_int("min", self.min)
-        put_int("quantmin", self.quantmin)
-        put_int("quantmax", self.quantmax)
-        put_int("cost", self.cost)
-        # flags
-        if any(int(v) != 0 for v in self.flags.values()) or True:
-            f = ET.SubElement(t, "flags")
-            for k, v in self.flags.items():
-                f.set(k, str(int(v)))
-        # category
+                parts.append(f"        <{tag}>{val}</{tag}>\n")
+        parts.append(_FLAGS_XML[self.flags])
         if self.category:
-            c = ET.SubElement(t, "category")
-            c.set("name", self.category)
-        # usages/values/tags
-        for u in self.usages:
-            ue = ET.SubElement(t, "usage")
-            ue.set("name", u)
-        for v in self.values:
-            ve = ET.SubElement(t, "value")
-            ve.set("name", v)
-        for tg in self.tags:
-            te = ET.SubElement(t, "tag")
-            te.set("name", tg)
-        return t
+            parts.append(f'        <category name="{_esc(self.category)}"/>\n')
+        for tag, items in (("usage", self.usages), ("value", self.values), ("tag", self.tags)):
+            for n in items:
+                parts.append(f'        <{tag} name="{_esc(n)}"/>\n')
+        parts.append("    </type>\n")
+        return "".join(parts)
 
 # ----------------------------- Utilities ----------------------------- #
 
-def prettify(elem: ET.Element) -> str:
-    """Return pretty-printed XML string (without external deps)."""
-    rough = ET.tostring(elem, encoding="utf-8")
-    try:
-        import xml.dom.minidom as minidom
-        reparsed = minidom.parseString(rough)
-        return reparsed.toprettyxml(indent="    ", encoding="utf-8").decode("utf-8")
-    except Exception:
-        return rough.decode("utf-8")
+def parse_types(path: str) -> Iterator[TypeEntry]:
+    """Yield the <type> entries of a types.xml file, using the fastest available parser."""
+    if _PARSER == "pygixml":
+        doc = pygixml.parse_file(path)  # keep a reference: nodes point into doc
+        root = doc.root
+        if root.name != "types":
+            raise ValueError("Root element is not <types>.")
+        for node in root.children():
+            if node.name == "type":
+                yield TypeEntry.from_pygixml(node)
+        return
+    root = None
+    depth = 0
+    # stream <type> entries; the first "start" event is the root
+    for event, elem in LET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+                if root.tag != "types":
+                    raise ValueError("Root element is not <types>.")
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and elem.tag == "type":
+            yield TypeEntry.from_xml(elem)
+            # detach it too; a cleared element left under root still costs memory
+            root.remove(elem)
 
 # ----------------------------- GUI Widgets ----------------------------- #
 
@@ -280,6 +376,8 @@ class ListEditor(QWidget):
     def __init__(self, label: str, presets: list[str] | None = None):
         super().__init__()
         self.list = QListWidget()
+        # insertion-ordered mirror of the texts in self.list (dict used as a set)
+        self._items: dict[str, None] = {}
 
         # Optional preset dropdown + Add button
         self.preset = None
@@ -315,18 +413,17 @@ class ListEditor(QWidget):
 
     def set_items(self, items: list[str]):
         self.list.clear()
-        for i in items:
-            self.list.addItem(i)
+        self._items = dict.fromkeys(items)
+        self.list.addItems(list(self._items))
 
     def get_items(self) -> list[str]:
-        return [self.list.item(i).text() for i in range(self.list.count())]
+        return list(self._items)
 
     def _add_text(self, text: str):
         text = text.strip()
-        if text:
-            existing = set(self.get_items())
-            if text not in existing:
-                self.list.addItem(text)
+        if text and text not in self._items:
+            self._items[text] = None
+            self.list.addItem(text)
 
     def add_item(self):
         self._add_text(self.input.text())
@@ -338,6 +435,7 @@ class ListEditor(QWidget):
 
     def remove_selected(self):
         for it in self.list.selectedItems():
+            self._items.pop(it.text(), None)
             self.list.takeItem(self.list.row(it))
 class TypeEditor(QWidget):
     def __init__(self):
@@ -352,17 +450,27 @@ class TypeEditor(QWidget):
         self.preset_combo.currentIndexChanged.connect(self._on_preset_changed)
 
         self.presets: Dict[str, TypeEntry] = {}
+        self._presets_signature = None  # key set the combo was last filled from
 
         self.name = QLineEdit()
-        self.nominal = QSpinBox(); self.nominal.setRange(-1, 10_000)
-        self.lifetime = QSpinBox(); self.lifetime.setRange(-1, 1_000_000)
-        self.restock = QSpinBox(); self.restock.setRange(-1, 1_000_000)
-        self.min = QSpinBox(); self.min.setRange(0, 10_000)
-        self.quantmin = QSpinBox(); self.quantmin.setRange(-1, 100_000)
-        self.quantmax = QSpinBox(); self.quantmax.setRange(-1, 100_000)
-        self.cost = QSpinBox(); self.cost.setRange(0, 1_000_000)
-        for sb in (self.nominal, self.lifetime, self.restock, self.min, self.quantmin, self.quantmax, self.cost):
-            sb.setSpecialValueText("")  # blanks when at minimum if appropriate
+        # every maximum is int32 so large vanilla values (e.g. 45-day lifetimes) aren't clamped
+        self.nominal = QSpinBox(); self.nominal.setRange(-1, SPIN_MAX)
+        self.lifetime = QSpinBox(); self.lifetime.setRange(-1, SPIN_MAX)
+        self.restock = QSpinBox(); self.restock.setRange(-1, SPIN_MAX)
+        self.min = QSpinBox(); self.min.setRange(0, SPIN_MAX)
+        self.quantmin = QSpinBox(); self.quantmin.setRange(-1, SPIN_MAX)
+        self.quantmax = QSpinBox(); self.quantmax.setRange(-1, SPIN_MAX)
+        self.cost = QSpinBox(); self.cost.setRange(0, SPIN_MAX)
+        self._spin_fields = (
+            ("nominal", self.nominal), ("lifetime", self.lifetime), ("restock", self.restock),
+            ("min", self.min), ("quantmin", self.quantmin), ("quantmax", self.quantmax),
+            ("cost", self.cost),
+        )
+        for _, sb in self._spin_fields:
+            # one extra step below the valid range is the "unset" sentinel; it
+            # displays as blank (Qt ignores an empty special text, so use " ")
+            sb.setMinimum(sb.minimum() - 1)
+            sb.setSpecialValueText(" ")
 
         form.addRow("Name", self.name)
         form.addRow("Nominal", self.nominal)
@@ -377,10 +485,7 @@ class TypeEditor(QWidget):
         flags_box = QGroupBox("Flags")
         fl = QHBoxLayout(flags_box)
         self.flag_checks: Dict[str, QCheckBox] = {}
-        for key in [
-            "count_in_cargo","count_in_hoarder","count_in_map",
-            "count_in_player","crafted","deloot"
-        ]:
+        for key in FLAG_KEYS:
             cb = QCheckBox(key)
             self.flag_checks[key] = cb
             fl.addWidget(cb)
@@ -411,19 +516,26 @@ class TypeEditor(QWidget):
         layout.addStretch(1)
 
     def set_category_options(self, categories: List[str]):
-        merged = list(dict.fromkeys(CATEGORY_PRESETS + sorted(set(categories))))
+        """`categories` must already be sorted and unique (see MainWindow.category_pool)."""
+        merged = list(dict.fromkeys(CATEGORY_PRESETS + categories))
         self.category.clear()
         self.category.addItems(merged)
 
     
     def set_presets(self, presets: Dict[str, TypeEntry]):
         """Provide available presets and populate the combo."""
-        self.presets = dict(sorted(presets.items()))
+        sig = (len(presets), hash(frozenset(presets)))
+        if sig == self._presets_signature:
+            # same names as before: keep the combo, just pick up reloaded entries
+            self.presets = {k: presets[k] for k in self.presets}
+            return
+        self._presets_signature = sig
+        names = sorted(presets)
+        self.presets = {k: presets[k] for k in names}
         self.preset_combo.blockSignals(True)
         self.preset_combo.clear()
         self.preset_combo.addItem("— choose preset —")
-        for name in self.presets.keys():
-            self.preset_combo.addItem(name)
+        self.preset_combo.addItems(names)
         self.preset_combo.blockSignals(False)
 
     def _on_preset_changed(self, idx: int):
@@ -436,37 +548,28 @@ class TypeEditor(QWidget):
             self.load_entry(entry)
 
     def load_entry(self, entry: Optional[TypeEntry]):
+        # only touch widgets whose value changes, with their signals blocked
         self.current = entry
-        if entry is None:
-            self.name.clear()
-            for sb in (self.nominal, self.lifetime, self.restock, self.min, self.quantmin, self.quantmax, self.cost):
-                sb.setValue(sb.minimum())
-            for k, cb in self.flag_checks.items():
-                cb.setChecked(False)
-            self.category.setEditText("")
-            self.usage_editor.set_items([])
-            self.value_editor.set_items([])
-            self.tag_editor.set_items([])
-            return
-        self.name.setText(entry.name)
-        def set_sb(sb: QSpinBox, val: Optional[int]):
-            if val is None:
-                sb.setValue(sb.minimum())
-            else:
-                sb.setValue(val)
-        set_sb(self.nominal, entry.nominal)
-        set_sb(self.lifetime, entry.lifetime)
-        set_sb(self.restock, entry.restock)
-        set_sb(self.min, entry.min)
-        set_sb(self.quantmin, entry.quantmin)
-        set_sb(self.quantmax, entry.quantmax)
-        set_sb(self.cost, entry.cost)
+        self.name.setText(entry.name if entry else "")
+        for field, sb in self._spin_fields:
+            val = getattr(entry, field) if entry else None
+            target = sb.minimum() if val is None else val
+            if sb.value() != target:
+                sb.blockSignals(True)
+                sb.setValue(target)
+                sb.blockSignals(False)
         for k, cb in self.flag_checks.items():
-            cb.setChecked(bool(entry.flags.get(k, 0)))
-        self.category.setEditText(entry.category or "")
-        self.usage_editor.set_items(entry.usages)
-        self.value_editor.set_items(entry.values)
-        self.tag_editor.set_items(entry.tags)
+            checked = bool(entry.flag(k)) if entry else False
+            if cb.isChecked() != checked:
+                cb.blockSignals(True)
+                cb.setChecked(checked)
+                cb.blockSignals(False)
+        cat = (entry.category or "") if entry else ""
+        if self.category.currentText() != cat:
+            self.category.setEditText(cat)
+        self.usage_editor.set_items(entry.usages if entry else [])
+        self.value_editor.set_items(entry.values if entry else [])
+        self.tag_editor.set_items(entry.tags if entry else [])
 
     def collect_entry(self) -> Optional[TypeEntry]:
         name = self.name.text().strip()
@@ -474,10 +577,10 @@ class TypeEditor(QWidget):
             QMessageBox.warning(self, "Validation", "Type name is required.")
             return None
         def val(sb: QSpinBox) -> Optional[int]:
-            # interpret special value (minimum) as unset when special text is empty
-            if sb.text() == "":
-                return None
-            return sb.value()
+            # the minimum is the blank "unset" sentinel set up in __init__;
+            # compare values instead of reading sb.text()
+            v = sb.value()
+            return None if v == sb.minimum() else v
         entry = TypeEntry(name=name)
         entry.nominal = val(self.nominal)
         entry.lifetime = val(self.lifetime)
@@ -486,8 +589,11 @@ class TypeEditor(QWidget):
         entry.quantmin = val(self.quantmin)
         entry.quantmax = val(self.quantmax)
         entry.cost = val(self.cost)
-        for k, cb in self.flag_checks.items():
-            entry.flags[k] = 1 if cb.isChecked() else 0
+        flags = 0
+        for i, k in enumerate(FLAG_KEYS):
+            if self.flag_checks[k].isChecked():
+                flags |= 1 << i
+        entry.flags = flags
         cat = self.category.currentText().strip()
         entry.category = cat if cat else None
         entry.usages = self.usage_editor.get_items()
@@ -506,12 +612,18 @@ class MainWindow(QMainWindow):
         self.resize(1100, 700)
 
         self.entries: List[TypeEntry] = []
+        self._name_index: Dict[str, int] = {}  # entry name -> row in self.entries
         self.preset_db: Dict[str, TypeEntry] = {}
-        self.category_pool: List[str] = []
+        self._category_set: set[str] = set()
+        self._category_sorted: Optional[List[str]] = None  # sorted view, None when stale
         self.current_path: Optional[str] = None
 
         # UI: left list + right editor
-        self.list = QListWidget()
+        # the type list is a view over a plain string model: no per-row item objects
+        self.list = QListView()
+        self._model = QStringListModel(self)
+        self.list.setModel(self._model)
+        self.list.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.editor = TypeEditor()
         self.editor.set_presets(self.preset_db)
 
@@ -532,7 +644,7 @@ class MainWindow(QMainWindow):
         left_layout.addLayout(hl)
         left_layout.addWidget(btn_save)
 
-        self.list.currentItemChanged.connect(self.on_select)
+        self.list.selectionModel().currentChanged.connect(self.on_select)
 
         splitter = QSplitter()
         splitter.addWidget(left_box)
@@ -550,6 +662,13 @@ class MainWindow(QMainWindow):
         # initialize editor categories
         self.editor.set_category_options(self.category_pool)
 
+    @property
+    def category_pool(self) -> List[str]:
+        """Sorted known categories, recomputed only after the set changes."""
+        if self._category_sorted is None:
+            self._category_sorted = sorted(self._category_set)
+        return self._category_sorted
+
     def _make_menu(self):
         menubar = self.menuBar()
         file_menu = menubar.addMenu("File")
@@ -585,14 +704,14 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            tree = ET.parse(path)
-            root = tree.getroot()
             count = 0
-            for elem in root.findall("type"):
-                entry = TypeEntry.from_xml(elem)
-                if entry and entry.name:
-                    self.preset_db[entry.name] = entry
+            loaded: Dict[str, TypeEntry] = {}
+            for entry in parse_types(path):
+                if entry.name:
+                    loaded[entry.name] = entry
                     count += 1
+            # only touch preset_db once the whole file has parsed
+            self.preset_db.update(loaded)
             # update editor combo
             self.editor.set_presets(self.preset_db)
             QMessageBox.information(self, "Presets Loaded", f"Loaded {count} presets from\n{path}")
@@ -604,39 +723,64 @@ class MainWindow(QMainWindow):
         self.editor.set_presets(self.preset_db)
 # ----- List management ----- #
     def refresh_list(self):
-        self.list.clear()
-        for e in self.entries:
-            item = QListWidgetItem(e.name)
-            self.list.addItem(item)
+        # one model reset; it drops the current row without emitting currentChanged
+        self._model.setStringList([e.name for e in self.entries])
+        self._name_index = {e.name: i for i, e in enumerate(self.entries)}
+        self.editor.load_entry(None)
         self.editor.set_category_options(self.category_pool)
 
-    def on_select(self, cur: Optional[QListWidgetItem], prev: Optional[QListWidgetItem]):
-        if cur is None:
+    def _reindex(self, start: int = 0):
+        """Refresh _name_index for rows from `start` on, after an insert/delete."""
+        for i in range(start, len(self.entries)):
+            self._name_index[self.entries[i].name] = i
+
+    def _unindex(self, name: str, idx: int):
+        """Drop row `idx` from _name_index before it is renamed or deleted.
+
+        Imported files may repeat a name; the slot then moves to another row
+        with that name instead of disappearing.
+        """
+        if self._name_index.get(name) != idx:
+            return  # the slot belongs to another row with the same name
+        del self._name_index[name]
+        if len(self._name_index) + 1 < len(self.entries):  # some names repeat
+            for i, e in enumerate(self.entries):
+                if i != idx and e.name == name:
+                    self._name_index[name] = i
+                    break
+
+    def _set_current_row(self, row: int):
+        # an out-of-range row gives an invalid index, which clears the current row
+        self.list.setCurrentIndex(self._model.index(row, 0))
+
+    def on_select(self, cur: QModelIndex, prev: QModelIndex):
+        if not cur.isValid():
             self.editor.load_entry(None)
             return
-        idx = self.list.row(cur)
+        idx = cur.row()
         if 0 <= idx < len(self.entries):
             self.editor.load_entry(self.entries[idx])
 
     def new_type(self):
         # Clear current selection so Save treats this as a new item
         self.list.clearSelection()
-        try:
-            self.list.setCurrentRow(-1)
-        except Exception:
-            pass
+        self.list.setCurrentIndex(QModelIndex())
         self.editor.load_entry(None)
         # start with sensible flags
         self.editor.flag_checks["count_in_map"].setChecked(True)
 
     def duplicate_type(self):
-        cur = self.list.currentItem()
-        if not cur:
+        cur = self.list.currentIndex()
+        if not cur.isValid():
             return
-        idx = self.list.row(cur)
+        idx = cur.row()
         src = self.entries[idx]
+        # names must stay unique for _name_index
+        name, n = src.name + "_Copy", 2
+        while name in self._name_index:
+            name, n = f"{src.name}_Copy{n}", n + 1
         dup = TypeEntry(
-            name=src.name + "_Copy",
+            name=name,
             nominal=src.nominal,
             lifetime=src.lifetime,
             restock=src.restock,
@@ -644,61 +788,83 @@ class MainWindow(QMainWindow):
             quantmin=src.quantmin,
             quantmax=src.quantmax,
             cost=src.cost,
-            flags=dict(src.flags),
+            flags=src.flags,
             category=src.category,
             usages=list(src.usages),
             values=list(src.values),
             tags=list(src.tags),
         )
         self.entries.insert(idx + 1, dup)
-        self.refresh_list()
-        self.list.setCurrentRow(idx + 1)
+        self._reindex(idx + 1)
+        self._model.insertRow(idx + 1)
+        self._model.setData(self._model.index(idx + 1, 0), dup.name)
+        self._set_current_row(idx + 1)
 
     def delete_type(self):
-        cur = self.list.currentItem()
-        if not cur:
+        cur = self.list.currentIndex()
+        if not cur.isValid():
             return
-        idx = self.list.row(cur)
+        idx = cur.row()
+        self._unindex(self.entries[idx].name, idx)
         del self.entries[idx]
-        self.refresh_list()
+        self._reindex(idx)
+        # removeRow moves the current row mid-removal, while rows are still
+        # shifting; reload the editor once afterwards instead
+        sel = self.list.selectionModel()
+        sel.blockSignals(True)
+        self._model.removeRow(idx)
+        sel.blockSignals(False)
         if self.entries:
-            self.list.setCurrentRow(min(idx, len(self.entries) - 1))
+            row = min(idx, len(self.entries) - 1)
+            self._set_current_row(row)
+            self.editor.load_entry(self.entries[row])
+        else:
+            self.editor.load_entry(None)
 
     def save_selected_changes(self):
         entry = self.editor.collect_entry()
         if entry is None:
             return
-        cur = self.list.currentItem()
-        if cur is None or getattr(self.editor, 'current', None) is None:
+        cur = self.list.currentIndex()
+        idx = cur.row()  # -1 when nothing is selected
+        if not cur.isValid() or getattr(self.editor, 'current', None) is None:
             # adding a new item
-            if any(e.name == entry.name for e in self.entries):
+            if entry.name in self._name_index:
                 QMessageBox.warning(self, "Duplicate", f"Type '{entry.name}' already exists.")
                 return
             self.entries.append(entry)
+            self._name_index[entry.name] = len(self.entries) - 1
+            row = self._model.rowCount()
+            self._model.insertRow(row)
+            self._model.setData(self._model.index(row, 0), entry.name)
+            idx = row
         else:
-            idx = self.list.row(cur)
+            old_name = self.entries[idx].name
             # prevent renaming to an existing name (other than self)
-            if any(e.name == entry.name for i, e in enumerate(self.entries) if i != idx):
+            if entry.name != old_name and entry.name in self._name_index:
                 QMessageBox.warning(self, "Duplicate", f"Type '{entry.name}' already exists.")
                 return
-            self.entries[idx] = entryry
-            self.list.item(idx).setText(entry.name)
+            self.entries[idx] = entry
+            if old_name != entry.name:
+                self._unindex(old_name, idx)
+                self._name_index[entry.name] = idx
+                self._model.setData(self._model.index(idx, 0), entry.name)
+            self.editor.current = entry
         # update category pool
-        if entry.category:
-            if entry.category not in self.category_pool:
-                self.category_pool.append(entry.category)
-        self.refresh_list()
+        if entry.category and entry.category not in self._category_set:
+            self._category_set.add(entry.category)
+            self._category_sorted = None
+            self.editor.set_category_options(self.category_pool)
+            self.editor.category.setEditText(entry.category)
         # keep selection on the saved/added item
-        for i, e in enumerate(self.entries):
-            if e.name == entry.name:
-                self.list.setCurrentRow(i)
-                break
+        self._set_current_row(idx)
 
     # ----- File actions ----- #
     def action_new(self):
         if self._confirm_discard_changes():
             self.entries.clear()
-            self.category_pool.clear()
+            self._category_set.clear()
+            self._category_sorted = None
             self.refresh_list()
             self.editor.load_entry(None)
             self.current_path = None
@@ -708,23 +874,19 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            tree = ET.parse(path)
-            root = tree.getroot()
-            if root.tag != "types":
-                raise ValueError("Root element is not <types>.")
             entries: List[TypeEntry] = []
             cats = set()
-            for t in root.findall("type"):
-                e = TypeEntry.from_xml(t)
+            for e in parse_types(path):
                 entries.append(e)
                 if e.category:
                     cats.add(e.category)
             self.entries = entries
-            self.category_pool = sorted(set(CATEGORY_PRESETS).union(cats))
+            self._category_set = set(CATEGORY_PRESETS).union(cats)
+            self._category_sorted = None
             self.refresh_list()
             self.current_path = path
             if self.entries:
-                self.list.setCurrentRow(0)
+                self._set_current_row(0)
         except Exception as ex:
             QMessageBox.critical(self, "Import Failed", f"Could not load types.xml:\n{ex}")
 
@@ -736,10 +898,11 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            root = ET.Element("types")
-            for e in self.entries:
-                root.append(e.to_xml())
-            xml_str = prettify(root)
+            xml_str = "".join([
+                '<?xml version="1.0" encoding="utf-8"?>\n<types>\n',
+                *[e.to_xml_str() for e in self.entries],
+                "</types>\n",
+            ])
             with open(path, "w", encoding="utf-8") as f:
                 f.write(xml_str)
             QMessageBox.information(self, "Exported", f"Saved to:\n{path}")
@@ -748,11 +911,11 @@ class MainWindow(QMainWindow):
 
 
     def toggle_dark_mode(self, checked: bool):
+        # setStyleSheet schedules its own repaint
         if checked:
             apply_dark_palette(QApplication.instance())
         else:
             apply_light_palette(QApplication.instance())
-        self.repaint()
     def _confirm_discard_changes(self) -> bool:
         # Simple prompt; could be extended with dirty-tracking
         res = QMessageBox.question(self, "Discard changes?", "This will clear the current list. Continue?",
@@ -763,6 +926,7 @@ class MainWindow(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyle("Fusion")
     win = MainWindow()
     win.show()
     sys.exit(app.exec())